@@ -0,0 +1,189 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+
+# ----------------------
+# Load Data
+# ----------------------
+# Columns the dashboard actually renders; the Parquet reader skips the rest
+DASHBOARD_COLUMNS = [
+    "No", "Status", "Summary", "Date Created", "To Do Dt",
+    "Assign To", "Priority", "Category", "Sub Category",
+    "Response Time (min)", "Resolution Time (min)",
+    "SLA_Respond_Met", "SLA_Resolution_Met",
+]
+
+# cache_resource rather than cache_data: every rerun and session gets the
+# same DataFrame object, which the helpers below rely on for their cache key.
+# Nothing downstream modifies it in place.
+@st.cache_resource
+def load_data():
+    url = 'https://raw.githubusercontent.com/dnlaql/cls-reporting/refs/heads/main/Data/workorder_with_sla.parquet'
+    # Date columns are stored as timestamps in the Parquet file, no parsing needed
+    df = pd.read_parquet(url, engine="pyarrow", dtype_backend="pyarrow", columns=DASHBOARD_COLUMNS)
+
+    # Every column has to arrive Arrow-backed; then Streamlit's conversion to
+    # Arrow for tables and charts wraps the buffers instead of re-encoding them
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes), df.dtypes
+    assert all(pa.types.is_timestamp(df[col].dtype.pyarrow_dtype) for col in ["Date Created", "To Do Dt"])
+    assert all(pa.types.is_boolean(df[col].dtype.pyarrow_dtype) for col in ["SLA_Respond_Met", "SLA_Resolution_Met"])
+
+    # Rows without a creation date, sub category or SLA flags can never pass
+    # the sidebar filters (none of those has a "missing" option), so drop them
+    # here. Selecting every option then keeps every row, which is what lets
+    # apply_filters skip such a filter outright.
+    df = df.dropna(subset=["Date Created", "Sub Category", "SLA_Respond_Met", "SLA_Resolution_Met"])
+
+    # Low-cardinality filter columns as category so .isin compares codes
+    for col in ["Priority", "Assign To", "Sub Category"]:
+        df[col] = df[col].astype("category")
+
+    # Filter options and defaults, computed once instead of on every rerun
+    # (tuples, since they are shared between sessions)
+    prio_opts = tuple(df["Priority"].unique().tolist())
+    assn_opts = tuple(df["Assign To"].unique().tolist())
+    sub_opts = tuple(df["Sub Category"].unique().tolist())
+    date_bounds = (df["Date Created"].min().date(), df["Date Created"].max().date())
+
+    return df, prio_opts, assn_opts, sub_opts, date_bounds
+
+# ----------------------
+# Filter data
+# ----------------------
+def category_mask(series, values):
+    # Mark the selected categories once, then gather that lookup by code.
+    # The trailing entry is hit by code -1 (NaN), which unique() lists as an
+    # option of its own.
+    values = list(values)
+    code_mask = np.append(series.cat.categories.isin(values), pd.isna(values).any())
+    return code_mask[series.cat.codes.to_numpy()]
+
+def status_mask(series, sla_status):
+    # Same lookup for an SLA_*_Met flag: index 0 (False) is FAIL, 1 is PASS
+    status_lookup = np.array(["FAIL" in sla_status, "PASS" in sla_status])
+    return status_lookup[series.to_numpy(dtype=bool, na_value=False).view(np.uint8)]
+
+def selection(values, options):
+    # None (skip the filter) when every option is selected
+    return None if len(values) == len(options) else tuple(values)
+
+# The cached helpers below hash DataFrame arguments by id() instead of by
+# content. `df` must be the object returned by load_data(), whose identity is
+# stable across reruns because it is held by st.cache_resource.
+# Each filter combination stores another result, so the caches are bounded.
+DATA_CACHE_ENTRIES = 32
+
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=DATA_CACHE_ENTRIES)
+def apply_filters(df, priorities, assignees, date_lo, date_hi, sla_status, subcategories):
+    # A None argument means the widget keeps every row, so its pass is skipped.
+    # AND the remaining conditions into one preallocated mask, in place.
+    mask = np.ones(len(df), dtype=bool)
+    if priorities is not None:
+        np.logical_and(mask, category_mask(df["Priority"], priorities), out=mask)
+    if assignees is not None:
+        np.logical_and(mask, category_mask(df["Assign To"], assignees), out=mask)
+
+    if date_lo is not None:
+        # Compare the raw datetime64 values against [date_lo, date_hi + 1 day)
+        # instead of building a datetime.date per row with .dt.date
+        dates = df["Date Created"].to_numpy()
+        np.logical_and(mask, dates >= np.datetime64(date_lo), out=mask)
+        np.logical_and(mask, dates < np.datetime64(date_hi) + np.timedelta64(1, "D"), out=mask)
+
+    if sla_status is not None:
+        np.logical_and(mask, status_mask(df["SLA_Respond_Met"], sla_status), out=mask)
+        np.logical_and(mask, status_mask(df["SLA_Resolution_Met"], sla_status), out=mask)
+
+    if subcategories is not None:
+        np.logical_and(mask, category_mask(df["Sub Category"], subcategories), out=mask)
+
+    return df.iloc[np.flatnonzero(mask)]
+
+# ----------------------
+# Aggregates
+# ----------------------
+def status_counts(filtered, by, met_col):
+    # Long-format PASS/FAIL counts per group, the shape px.bar expects.
+    # observed=True only visits combinations present in the filtered rows,
+    # not the full category product. The flag is only turned into a
+    # PASS/FAIL label here, on the aggregated rows.
+    counts = filtered.groupby([by, met_col], observed=True).size().reset_index(name="Count")
+    counts[met_col] = np.where(counts[met_col].to_numpy(dtype=bool), "PASS", "FAIL")
+    return counts
+
+def group_means(codes, values, n_groups):
+    # Per-category mean of `values`, using result arrays sized to the number
+    # of categories and indexed by code (rows with NaN code or value skipped)
+    valid = (codes >= 0) & ~np.isnan(values)
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=n_groups)
+    counts = np.bincount(codes[valid], minlength=n_groups)
+    return np.divide(sums, counts, out=np.full(n_groups, np.nan), where=counts > 0)
+
+BREACH_TOP_N = 20
+
+# Per-priority means are code-indexed bincounts rather than a groupby, and
+# PASS counts come straight from the SLA flag arrays.
+@st.cache_data(hash_funcs={pd.DataFrame: id}, max_entries=DATA_CACHE_ENTRIES)
+def compute_aggregates(df, *filters):
+    filtered = apply_filters(df, *filters)
+
+    priority = filtered["Priority"].cat
+    prio_codes = priority.codes.to_numpy()
+    n_prio = len(priority.categories)
+    resp_time = filtered["Response Time (min)"].to_numpy(dtype=float, na_value=np.nan)
+    reso_time = filtered["Resolution Time (min)"].to_numpy(dtype=float, na_value=np.nan)
+    resp_time_valid = ~np.isnan(resp_time)
+
+    # Only priorities that still have rows after filtering get a bar
+    observed = np.bincount(prio_codes[prio_codes >= 0], minlength=n_prio) > 0
+    time_df = pd.DataFrame({
+        "Priority": priority.categories[observed],
+        "Response Time (min)": group_means(prio_codes, resp_time, n_prio)[observed],
+        "Resolution Time (min)": group_means(prio_codes, reso_time, n_prio)[observed],
+    })
+
+    # Fetch each flag column once and share it between the KPIs, the pies
+    # and the breach counts
+    resp = filtered["SLA_Respond_Met"].to_numpy(dtype=bool, na_value=False)
+    reso = filtered["SLA_Resolution_Met"].to_numpy(dtype=bool, na_value=False)
+    total = resp.size
+    resp_pass = np.count_nonzero(resp)
+    reso_pass = np.count_nonzero(reso)
+
+    # Breaches per assignee: bincount the Assign To codes of the breach rows,
+    # then keep assignees with at least one breach, most breaches first.
+    # Ties are broken by category (alphabetical) order, so the bar order is
+    # deterministic. value_counts' tie order was not.
+    # Beyond the top BREACH_TOP_N the tail is summed into a single "Other" bar.
+    assignee = filtered["Assign To"].cat
+    breach_mask = ~(resp & reso)
+    breach_codes = assignee.codes.to_numpy()[breach_mask]
+    breaches = np.bincount(breach_codes[breach_codes >= 0], minlength=len(assignee.categories))
+    order = np.argsort(-breaches, kind="stable")
+    order = order[breaches[order] > 0]
+    top, tail = order[:BREACH_TOP_N], order[BREACH_TOP_N:]
+    breach_labels = assignee.categories[top].tolist()
+    breach_values = breaches[top].tolist()
+    if len(tail):
+        breach_labels.append("Other")
+        breach_values.append(int(breaches[tail].sum()))
+    breach_count = pd.DataFrame({"Assign To": breach_labels, "SLA Breaches": breach_values})
+
+    status_charts = {
+        (by, met_col): status_counts(filtered, by, met_col)
+        for by in ["Priority", "Sub Category"]
+        for met_col in ["SLA_Respond_Met", "SLA_Resolution_Met"]
+    }
+
+    return {
+        "total": total,
+        "avg_response": resp_time[resp_time_valid].mean() if resp_time_valid.any() else float("nan"),
+        "response_pass_pct": resp_pass * 100.0 / total if total else float("nan"),
+        "resolution_pass_pct": reso_pass * 100.0 / total if total else float("nan"),
+        "time_df": time_df,
+        "response_pie": pd.DataFrame({"Status": ["PASS", "FAIL"], "Count": [resp_pass, total - resp_pass]}),
+        "resolution_pie": pd.DataFrame({"Status": ["PASS", "FAIL"], "Count": [reso_pass, total - reso_pass]}),
+        "breach_count": breach_count,
+        "status_charts": status_charts,
+    }
@@ -1,26 +1,17 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from data import load_data, apply_filters, compute_aggregates, selection
 
 # ----------------------
 # Load Data
 # ----------------------
-@st.cache_data
-def load_data():
-    url = 'https://raw.githubusercontent.com/dnlaql/cls-reporting/refs/heads/main/Data/workorder_with_sla%20(1).csv'
-    df = pd.read_csv(url)
-
-    # Convert date columns
-    df["Date Created"] = pd.to_datetime(df["Date Created"], errors='coerce')
-    df["To Do Dt"] = pd.to_datetime(df["To Do Dt"], errors='coerce')
-
-    # Map boolean to PASS/FAIL
-    df["SLA_Respond_Status"] = df["SLA_Respond_Met"].map({True: "PASS", False: "FAIL"})
-    df["SLA_Resolution_Status"] = df["SLA_Resolution_Met"].map({True: "PASS", False: "FAIL"})
-
-    return df
-
-df = load_data()
+# Loading, filtering and aggregation live in data.py so every page shares the
+# same cached results
+df, prio_opts, assn_opts, sub_opts, date_bounds = load_data()
 
 # ----------------------
 # Sidebar Filters with Reset
@@ -31,10 +22,10 @@ st.sidebar.image("https://hctm.ukm.my/ent/wp-content/uploads/2022/11/3LOGOS-HCTM
 
 # Initialize session state on first run
 if 'initialized' not in st.session_state:
-    st.session_state['priorities'] = df["Priority"].unique().tolist()
-    st.session_state['assignees'] = df["Assign To"].unique().tolist()
-    st.session_state['date_range'] = [df["Date Created"].min().date(), df["Date Created"].max().date()]
-    st.session_state['subcategories'] = df["Sub Category"].dropna().unique().tolist() if "Sub Category" in df.columns else []
+    st.session_state['priorities'] = list(prio_opts)
+    st.session_state['assignees'] = list(assn_opts)
+    st.session_state['date_range'] = list(date_bounds)
+    st.session_state['subcategories'] = list(sub_opts)
     st.session_state['sla_status'] = ["PASS", "FAIL"]
     st.session_state['reset'] = False
     st.session_state['initialized'] = True
@@ -43,38 +34,34 @@ st.sidebar.title("Filters")
 
 # Reset Filters
 if st.sidebar.button("Reset Filters"):
-    st.session_state['priorities'] = df["Priority"].unique().tolist()
-    st.session_state['assignees'] = df["Assign To"].unique().tolist()
-    st.session_state['date_range'] = [df["Date Created"].min().date(), df["Date Created"].max().date()]
-    st.session_state['subcategories'] = df["Sub Category"].dropna().unique().tolist() if "Sub Category" in df.columns else []
+    st.session_state['priorities'] = list(prio_opts)
+    st.session_state['assignees'] = list(assn_opts)
+    st.session_state['date_range'] = list(date_bounds)
+    st.session_state['subcategories'] = list(sub_opts)
     st.session_state['sla_status'] = ["PASS", "FAIL"]
     st.session_state['reset'] = True
 
-priorities = st.sidebar.multiselect("Select Priority", options=df["Priority"].unique(), default=st.session_state['priorities'], key='priorities')
-assignees = st.sidebar.multiselect("Select Assignee", options=df["Assign To"].unique(), default=st.session_state['assignees'], key='assignees')
+priorities = st.sidebar.multiselect("Select Priority", options=prio_opts, default=st.session_state['priorities'], key='priorities')
+assignees = st.sidebar.multiselect("Select Assignee", options=assn_opts, default=st.session_state['assignees'], key='assignees')
 date_range = st.sidebar.date_input("Select Date Range", value=st.session_state['date_range'], key='date_range')
 
 # SLA Status Filter
 sla_status_filter = st.sidebar.multiselect("SLA Status (PASS/FAIL)", options=["PASS", "FAIL"], default=st.session_state['sla_status'], key='sla_status')
 
-# Add Sub Category Filter if available
-if "Sub Category" in df.columns:
-    subcategories = st.sidebar.multiselect("Select Sub Category", options=df["Sub Category"].dropna().unique(), default=st.session_state['subcategories'], key='subcategories')
-else:
-    subcategories = []
+# Sub Category Filter
+subcategories = st.sidebar.multiselect("Select Sub Category", options=sub_opts, default=st.session_state['subcategories'], key='subcategories')
 
 # Filter data
-filtered_df = df[
-    (df["Priority"].isin(priorities)) &
-    (df["Assign To"].isin(assignees)) &
-    (df["Date Created"].dt.date >= date_range[0]) &
-    (df["Date Created"].dt.date <= date_range[1]) &
-    (df["SLA_Respond_Status"].isin(sla_status_filter)) &
-    (df["SLA_Resolution_Status"].isin(sla_status_filter))
-]
+date_lo, date_hi = date_range[0], date_range[1]
+if (date_lo, date_hi) == date_bounds:
+    date_lo = date_hi = None
 
-if "Sub Category" in df.columns:
-    filtered_df = filtered_df[filtered_df["Sub Category"].isin(subcategories)]
+filters = (
+    selection(priorities, prio_opts), selection(assignees, assn_opts), date_lo, date_hi,
+    selection(sla_status_filter, ["PASS", "FAIL"]), selection(subcategories, sub_opts)
+)
+filtered_df = apply_filters(df, *filters)
+aggregates = compute_aggregates(df, *filters)
 
 # ----------------------
 # Page Title and Description
@@ -91,106 +78,124 @@ It helps to monitor and analyze work orders based on response and resolution com
 left_col, right_col = st.columns(2)
 
 with left_col:
-    st.metric("📋 Total Work Orders", len(filtered_df))
-    st.metric("⏱️ Avg Response Time (min)", round(filtered_df["Response Time (min)"].mean(), 2))
+    st.metric("📋 Total Work Orders", aggregates["total"])
+    st.metric("⏱️ Avg Response Time (min)", round(aggregates["avg_response"], 2))
 
 with right_col:
-    st.metric("✅ SLA Response PASS %", f"{(filtered_df['SLA_Respond_Met'] == True).mean() * 100:.1f}%")
-    st.metric("✅ SLA Resolution PASS %", f"{(filtered_df['SLA_Resolution_Met'] == True).mean() * 100:.1f}%")
+    st.metric("✅ SLA Response PASS %", f"{aggregates['response_pass_pct']:.1f}%")
+    st.metric("✅ SLA Resolution PASS %", f"{aggregates['resolution_pass_pct']:.1f}%")
 
 # ----------------------
 # Charts
 # ----------------------
-st.subheader("📌 SLA Compliance by Priority")
-chart_col1, chart_col2 = st.columns(2)
-
-with chart_col1:
-    respond_fig = px.histogram(
-        filtered_df,
-        x="Priority",
-        color="SLA_Respond_Status",
-        barmode="group",
-        title="🟡 Response SLA Compliance by Priority"
-    )
-    st.plotly_chart(respond_fig, use_container_width=True)
-
-with chart_col2:
-    resolution_fig = px.histogram(
-        filtered_df,
-        x="Priority",
-        color="SLA_Resolution_Status",
-        barmode="group",
-        title="🔵 Resolution SLA Compliance by Priority"
+# Figures are built by st.cache_resource functions keyed on the aggregated
+# values (as tuples), so unchanged filters reuse the same Figure objects.
+# Each cache is bounded, since every distinct filter combination adds an entry.
+FIGURE_CACHE_ENTRIES = 100
+STATUS_COLORS = {"PASS": px.colors.qualitative.Plotly[0], "FAIL": px.colors.qualitative.Plotly[1]}
+
+def as_records(frame):
+    # Hashable (row tuple) form of a small aggregate frame
+    return tuple(frame.itertuples(index=False, name=None))
+
+# Each response/resolution pair is drawn as one figure with two subplots
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_status_pair_fig(by, titles, respond_counts, resolution_counts):
+    fig = make_subplots(rows=1, cols=2, subplot_titles=titles)
+    for col, counts in enumerate([respond_counts, resolution_counts], start=1):
+        for status in ["PASS", "FAIL"]:
+            rows = [(group, count) for group, row_status, count in counts if row_status == status]
+            fig.add_trace(
+                go.Bar(
+                    x=[str(group) for group, _ in rows], y=[count for _, count in rows], name=status,
+                    legendgroup=status, showlegend=col == 1, marker_color=STATUS_COLORS[status]
+                ),
+                row=1, col=col
+            )
+    fig.update_layout(barmode="group", legend_title_text="SLA Status")
+    fig.update_xaxes(title_text=by)
+    fig.update_yaxes(title_text="Count", row=1, col=1)
+    return fig
+
+def status_pair_fig(by, titles):
+    status_charts = aggregates["status_charts"]
+    return build_status_pair_fig(
+        by, titles,
+        as_records(status_charts[(by, "SLA_Respond_Met")]),
+        as_records(status_charts[(by, "SLA_Resolution_Met")])
     )
-    st.plotly_chart(resolution_fig, use_container_width=True)
+
+st.subheader("📌 SLA Compliance by Priority")
+priority_fig = status_pair_fig(
+    "Priority",
+    ("🟡 Response SLA Compliance by Priority", "🔵 Resolution SLA Compliance by Priority")
+)
+st.plotly_chart(priority_fig, use_container_width=True)
 
 # ----------------------
 # SLA Compliance by Sub Category
 # ----------------------
-if "Sub Category" in filtered_df.columns:
-    st.subheader("📌 SLA Compliance by Sub Category")
-    sub_col1, sub_col2 = st.columns(2)
-
-    with sub_col1:
-        sub_respond_fig = px.histogram(
-            filtered_df,
-            x="Sub Category",
-            color="SLA_Respond_Status",
-            barmode="group",
-            title="🟡 Response SLA by Sub Category"
-        )
-        st.plotly_chart(sub_respond_fig, use_container_width=True)
-
-    with sub_col2:
-        sub_resolution_fig = px.histogram(
-            filtered_df,
-            x="Sub Category",
-            color="SLA_Resolution_Status",
-            barmode="group",
-            title="🔵 Resolution SLA by Sub Category"
-        )
-        st.plotly_chart(sub_resolution_fig, use_container_width=True)
+st.subheader("📌 SLA Compliance by Sub Category")
+sub_fig = status_pair_fig(
+    "Sub Category",
+    ("🟡 Response SLA by Sub Category", "🔵 Resolution SLA by Sub Category")
+)
+st.plotly_chart(sub_fig, use_container_width=True)
 
 # ----------------------
 # Average Times by Priority
 # ----------------------
 st.subheader("⏳ Average Times by Priority")
-time_df = filtered_df.groupby("Priority")[["Response Time (min)", "Resolution Time (min)"]].mean().reset_index()
-time_fig = px.bar(
-    time_df.melt(id_vars="Priority", var_name="Metric", value_name="Minutes"),
-    x="Priority", y="Minutes", color="Metric", barmode="group",
-    title="⏱️ Avg Response & Resolution Time by Priority"
-)
+
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_time_fig(time_records):
+    time_df = pd.DataFrame(list(time_records), columns=["Priority", "Response Time (min)", "Resolution Time (min)"])
+    return px.bar(
+        time_df.melt(id_vars="Priority", var_name="Metric", value_name="Minutes"),
+        x="Priority", y="Minutes", color="Metric", barmode="group",
+        title="⏱️ Avg Response & Resolution Time by Priority"
+    )
+
+time_fig = build_time_fig(as_records(aggregates["time_df"]))
 st.plotly_chart(time_fig, use_container_width=True)
 
 # ----------------------
 # SLA Breach by Assignee
 # ----------------------
 st.subheader("🚨 SLA Breaches by Assignee")
-breach_df = filtered_df[(filtered_df["SLA_Respond_Met"] == False) | (filtered_df["SLA_Resolution_Met"] == False)]
-breach_count = breach_df["Assign To"].value_counts().reset_index()
-breach_count.columns = ["Assign To", "SLA Breaches"]
 
-breach_fig = px.bar(breach_count, x="Assign To", y="SLA Breaches", title="🚨 SLA Breach Count by Assignee")
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_breach_fig(labels, counts):
+    breach_count = pd.DataFrame({"Assign To": list(labels), "SLA Breaches": list(counts)})
+    return px.bar(breach_count, x="Assign To", y="SLA Breaches", title="🚨 SLA Breach Count by Assignee")
+
+breach_count = aggregates["breach_count"]
+breach_fig = build_breach_fig(tuple(breach_count["Assign To"]), tuple(breach_count["SLA Breaches"]))
 st.plotly_chart(breach_fig, use_container_width=True)
 
 # ----------------------
 # SLA Status Pie Charts
 # ----------------------
 st.subheader("📊 SLA Status Distribution")
-pie_col1, pie_col2 = st.columns(2)
 
-with pie_col1:
-    response_pie = filtered_df["SLA_Respond_Status"].value_counts().reset_index()
-    response_pie.columns = ["Status", "Count"]
-    response_pie_fig = px.pie(response_pie, names="Status", values="Count", title="🟡 SLA Response: PASS vs FAIL")
-    st.plotly_chart(response_pie_fig, use_container_width=True)
+@st.cache_resource(max_entries=FIGURE_CACHE_ENTRIES)
+def build_pie_fig(response_counts, resolution_counts):
+    pie_fig = make_subplots(
+        rows=1, cols=2, specs=[[{"type": "domain"}, {"type": "domain"}]],
+        subplot_titles=["🟡 SLA Response: PASS vs FAIL", "🔵 SLA Resolution: PASS vs FAIL"]
+    )
+    for col, counts in enumerate([response_counts, resolution_counts], start=1):
+        pie_fig.add_trace(
+            go.Pie(
+                labels=[status for status, _ in counts], values=[count for _, count in counts],
+                marker_colors=[STATUS_COLORS[status] for status, _ in counts]
+            ),
+            row=1, col=col
+        )
+    return pie_fig
 
-with pie_col2:
-    resolution_pie = filtered_df["SLA_Resolution_Status"].value_counts().reset_index()
-    resolution_pie.columns = ["Status", "Count"]
-    resolution_pie_fig = px.pie(resolution_pie, names="Status", values="Count", title="🔵 SLA Resolution: PASS vs FAIL")
-    st.plotly_chart(resolution_pie_fig, use_container_width=True)
+pie_fig = build_pie_fig(as_records(aggregates["response_pie"]), as_records(aggregates["resolution_pie"]))
+st.plotly_chart(pie_fig, use_container_width=True)
 
 # ----------------------
 # Monthly SLA Resolution Compliance Only
@@ -198,7 +203,7 @@ with pie_col2:
 st.subheader("📅 Monthly SLA Resolution Compliance (%)")
 
 monthly_df = filtered_df.copy()
-monthly_df['Month'] = monthly_df['Date Created'].dt.to_period('M')
+monthly_df['Month'] = monthly_df['Date Created'].astype('datetime64[us]').dt.to_period('M')
 
 monthly_compliance = monthly_df.groupby('Month').apply(
     lambda x: pd.Series({
@@ -214,4 +219,16 @@ st.dataframe(monthly_compliance, use_container_width=True)
 # Data Table
 # ----------------------
 st.subheader("📝 Detailed Work Orders Table")
-st.dataframe(filtered_df, use_container_width=True)
+# Only the first rows go to the browser; the full result is a download
+TABLE_PREVIEW_ROWS = 1000
+if len(filtered_df) > TABLE_PREVIEW_ROWS:
+    st.caption(f"Showing the first {TABLE_PREVIEW_ROWS:,} of {len(filtered_df):,} work orders.")
+st.dataframe(filtered_df.head(TABLE_PREVIEW_ROWS), use_container_width=True)
+
+st.download_button(
+    "Download full results",
+    # Callable, so the Parquet bytes are only built when the button is clicked
+    data=lambda: filtered_df.to_parquet(index=False),
+    file_name="results.parquet",
+    mime="application/vnd.apache.parquet"
+)